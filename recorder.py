@@ -1,12 +1,42 @@
 import tkinter as tk
 from tkinter import ttk
+import asyncio
 import json
 import threading
+import tracemalloc
+from collections import Counter, deque
+from datetime import datetime, timedelta
 from pynput import mouse, keyboard
 import time
 from pathlib import Path
 import sys
 
+def compress_idle(actions, threshold, cap):
+    """Shorten idle gaps longer than threshold down to cap.
+
+    Gaps leading into a click or while any button is held are kept as recorded.
+    Returns the new action list and the seconds saved per run.
+    """
+    if threshold <= 0:
+        raise ValueError("Idle threshold must be greater than 0 seconds")
+    cap = max(0.0, min(cap, threshold))
+    compressed = []
+    saved = 0.0
+    last_time = 0.0
+    pressed = set()
+    for action in actions:
+        gap = action['e'] - last_time
+        if gap > threshold and action['t'] != 'c' and not pressed:
+            saved += gap - cap
+        compressed.append(dict(action, e=round(action['e'] - saved, 3)))
+        if action['t'] == 'c':
+            if action['p']:
+                pressed.add(action['b'])
+            else:
+                pressed.discard(action['b'])
+        last_time = action['e']
+    return compressed, saved
+
 class ProfileManager:
     def __init__(self, path="profiles.json"):
         self.path = Path(path)
@@ -39,6 +69,369 @@ class ProfileManager:
             del self.profiles[name]
             self.save()
 
+class CronTrigger:
+    """Fires on minutes matching a five-field cron expression.
+
+    Supports '*', numbers, ranges 'a-b', lists 'a,b' and steps '*/n'.
+    As in standard cron, when both day of month and day of week are
+    restricted either one matching is enough (0 is Sunday).
+    """
+    FIELD_RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 6)]
+    
+    def __init__(self, expression):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Expected 5 cron fields, got {len(fields)}")
+        self.minutes, self.hours, self.days, self.months, self.weekdays = [
+            self.parse_field(field, low, high)
+            for field, (low, high) in zip(fields, self.FIELD_RANGES)
+        ]
+        self.days_restricted = not fields[2].startswith('*')
+        self.weekdays_restricted = not fields[4].startswith('*')
+        self.last_due = 0
+    
+    @staticmethod
+    def parse_field(field, low, high):
+        values = set()
+        for part in field.split(','):
+            step = 1
+            if '/' in part:
+                part, step = part.split('/', 1)
+                step = int(step)
+                if step < 1:
+                    raise ValueError(f"Invalid cron step in '{field}'")
+            if part == '*':
+                start, end = low, high
+            elif '-' in part:
+                start, end = (int(v) for v in part.split('-', 1))
+            else:
+                start = int(part)
+                end = high if step > 1 else start
+            if start < low or end > high or start > end:
+                raise ValueError(f"Cron value out of range in '{field}'")
+            values.update(range(start, end + 1, step))
+        return values
+    
+    def day_matches(self, moment):
+        day_ok = moment.day in self.days
+        weekday_ok = (moment.weekday() + 1) % 7 in self.weekdays
+        if self.days_restricted and self.weekdays_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+    
+    def matches(self, moment):
+        return (
+            moment.minute in self.minutes
+            and moment.hour in self.hours
+            and moment.month in self.months
+            and self.day_matches(moment)
+        )
+    
+    def next_delay(self):
+        now = time.time()
+        # Never fire the same minute twice, even if the loop wakes up early
+        start = datetime.fromtimestamp(max(now, self.last_due + 1))
+        moment = start.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        # Cover a full leap-year cycle so dates like Feb 29 are still found
+        limit = moment + timedelta(days=366 * 8)
+        while not self.matches(moment):
+            if moment > limit:
+                raise ValueError("Cron expression never matches")
+            if moment.month not in self.months or not self.day_matches(moment):
+                moment = moment.replace(hour=0, minute=0) + timedelta(days=1)
+            elif moment.hour not in self.hours:
+                moment = moment.replace(minute=0) + timedelta(hours=1)
+            else:
+                moment += timedelta(minutes=1)
+        self.last_due = moment.timestamp()
+        return self.last_due - now
+    
+    def is_due(self):
+        return True
+
+class IntervalTrigger:
+    """Fires every fixed number of seconds."""
+    def __init__(self, seconds):
+        if seconds <= 0:
+            raise ValueError("Interval must be greater than 0 seconds")
+        self.seconds = seconds
+        self.next_time = time.time() + seconds
+    
+    def next_delay(self):
+        return max(self.next_time - time.time(), 0)
+    
+    def is_due(self):
+        now = time.time()
+        # Skip missed ticks rather than firing them back to back
+        self.next_time += self.seconds
+        if self.next_time <= now:
+            self.next_time = now + self.seconds
+        return True
+
+class IdleTrigger:
+    """Fires once the mouse has been idle for a number of seconds.
+
+    Fires once per idle stretch; new input re-arms it.
+    """
+    def __init__(self, seconds, last_input):
+        if seconds <= 0:
+            raise ValueError("Idle time must be greater than 0 seconds")
+        self.seconds = seconds
+        self.last_input = last_input
+        self.fired_input = None
+    
+    def next_delay(self):
+        last_input = self.last_input()
+        if last_input == self.fired_input:
+            # Already fired for this idle stretch, check back for new input
+            return self.seconds
+        return max(self.seconds - (time.time() - last_input), 0)
+    
+    def is_due(self):
+        last_input = self.last_input()
+        if last_input == self.fired_input or time.time() - last_input < self.seconds:
+            return False
+        self.fired_input = last_input
+        return True
+
+def make_trigger(job, last_input):
+    kind = job.get('trigger')
+    if kind == 'cron':
+        return CronTrigger(str(job['spec']))
+    if kind == 'interval':
+        return IntervalTrigger(float(job['spec']))
+    if kind == 'idle':
+        return IdleTrigger(float(job['spec']), last_input)
+    raise ValueError(f"Unknown trigger '{kind}'")
+
+class Scheduler:
+    """Runs scheduled playbacks from a single asyncio event loop thread.
+
+    Each job is a dict with 'recording', 'trigger' ('cron', 'interval' or
+    'idle'), 'spec', 'repeats' and 'overlap'. The overlap policy decides what
+    happens when a job fires while something else is playing:
+    'skip' drops the run, 'queue' waits its turn and 'preempt' stops the
+    current playback and runs next.
+    """
+    OVERLAP_POLICIES = ('skip', 'queue', 'preempt')
+    MAX_SLEEP = 60  # Re-check the wall clock so suspend/resume doesn't delay runs
+    
+    def __init__(self, recorder):
+        self.recorder = recorder
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name="scheduler", daemon=True)
+        self.watchers = []
+        self.pending = deque()
+        self.wakeup = None
+        self.running_job = None
+    
+    def start(self):
+        self.loop.call_soon_threadsafe(self._start_runner)
+        self.thread.start()
+    
+    def stop(self):
+        self.loop.call_soon_threadsafe(self._shutdown)
+    
+    def _shutdown(self):
+        for task in asyncio.all_tasks(self.loop):
+            task.cancel()
+        # Stop after the cancellations have been processed
+        self.loop.call_soon(self.loop.stop)
+    
+    def set_jobs(self, jobs):
+        self.loop.call_soon_threadsafe(self._set_jobs, [dict(job) for job in jobs])
+    
+    def _start_runner(self):
+        self.wakeup = asyncio.Event()
+        self.loop.create_task(self._run_pending())
+    
+    def _set_jobs(self, jobs):
+        for watcher in self.watchers:
+            watcher.cancel()
+        self.watchers = []
+        self.pending.clear()
+        
+        tracks_idle = False
+        for job in jobs:
+            if not job.get('enabled', True):
+                continue
+            try:
+                trigger = make_trigger(job, lambda: self.recorder.last_input_time)
+            except (KeyError, ValueError) as e:
+                print(f"Skipping schedule for {job.get('recording')}: {e}")
+                continue
+            tracks_idle = tracks_idle or isinstance(trigger, IdleTrigger)
+            self.watchers.append(self.loop.create_task(self._watch(job, trigger)))
+        
+        self.recorder.set_activity_tracking(tracks_idle)
+    
+    async def _watch(self, job, trigger):
+        while True:
+            try:
+                delay = trigger.next_delay()
+            except ValueError as e:
+                print(f"Stopping schedule for {job.get('recording')}: {e}")
+                return
+            due_time = time.time() + delay
+            while (remaining := due_time - time.time()) > 0:
+                await asyncio.sleep(min(remaining, self.MAX_SLEEP))
+            if trigger.is_due():
+                self._submit(job)
+    
+    def _submit(self, job):
+        if job is self.running_job or job in self.pending:
+            return
+        
+        policy = job.get('overlap', 'skip')
+        busy = self.running_job is not None or self.pending or self.recorder.is_busy()
+        if policy == 'preempt':
+            self.pending.appendleft(job)
+            if self.recorder.playing:
+                self.recorder.stop_playback()
+        elif policy == 'queue':
+            self.pending.append(job)
+        elif not busy:
+            self.pending.append(job)
+        self.wakeup.set()
+    
+    async def _run_pending(self):
+        while True:
+            await self.wakeup.wait()
+            self.wakeup.clear()
+            
+            while self.pending:
+                # Wait out manual playback, recording, or a stopping playback thread
+                while self.recorder.is_busy():
+                    await asyncio.sleep(0.25)
+                if not self.pending:
+                    break
+                
+                job = self.pending.popleft()
+                done = self.loop.create_future()
+                
+                def finished(done=done):
+                    if not done.done():
+                        done.set_result(None)
+                
+                try:
+                    started = self.recorder.start_playback(
+                        job['recording'],
+                        int(job.get('repeats', 1)),
+                        0,
+                        False,
+                        on_done=lambda: self.loop.call_soon_threadsafe(finished)
+                    )
+                except Exception as e:
+                    print(f"Error starting scheduled playback of {job.get('recording')}: {e}")
+                    continue
+                if started:
+                    self.running_job = job
+                    await done
+                    self.running_job = None
+
+class RuntimeProfiler:
+    """Samples thread stacks and allocations while switched on.
+
+    Nothing runs while it is off. Stopping writes collapsed stacks
+    (for flamegraph tools) and the top allocation sites to output_dir on
+    a worker thread, then calls on_report(stacks_path, error).
+    """
+    def __init__(self, output_dir, interval=0.005, top_allocations=25):
+        self.output_dir = Path(output_dir)
+        self.interval = interval
+        self.top_allocations = top_allocations
+        self.active = False
+        self.samples = Counter()
+        self.stop_event = threading.Event()
+        self.sampler_thread = None
+        self.lock = threading.RLock()
+    
+    def toggle(self, on_report=None):
+        # Hotkey and button run on different threads, so decide under the lock
+        with self.lock:
+            if self.active:
+                return self.stop(on_report)
+            self.start()
+            return None
+    
+    def start(self):
+        with self.lock:
+            if self.active:
+                return
+            self.active = True
+            self.samples = Counter()
+            self.stop_event.clear()
+            tracemalloc.start(10)
+            self.sampler_thread = threading.Thread(target=self.sample, name="profiler", daemon=True)
+            self.sampler_thread.start()
+    
+    def stop(self, on_report=None):
+        with self.lock:
+            if not self.active:
+                return None
+            self.active = False
+            self.stop_event.set()
+            self.sampler_thread.join()
+            snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")[:-3]
+        
+        # Keep report writing off the hotkey and Tk threads
+        report_thread = threading.Thread(
+            target=self.write_report,
+            args=(snapshot, self.samples, stamp, on_report),
+            name="profiler-report",
+            daemon=True
+        )
+        report_thread.start()
+        return report_thread
+    
+    def write_report(self, snapshot, samples, stamp, on_report):
+        try:
+            report, error = self.dump(snapshot, samples, stamp), None
+        except Exception as e:
+            report, error = None, e
+            print(f"Error writing profile report: {e}")
+        if on_report:
+            on_report(report, error)
+    
+    def sample(self):
+        own_id = threading.get_ident()
+        while not self.stop_event.wait(self.interval):
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({Path(code.co_filename).name})")
+                    frame = frame.f_back
+                name = names.get(thread_id, str(thread_id))
+                if name == "MainThread":
+                    name = "tk"
+                stack.append(name)
+                self.samples[";".join(reversed(stack))] += 1
+    
+    def dump(self, snapshot, samples, stamp):
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        
+        stacks_path = self.output_dir / f"{stamp}-stacks.folded"
+        with stacks_path.open("w", encoding="utf-8") as f:
+            for stack, count in samples.most_common():
+                f.write(f"{stack} {count}\n")
+        
+        # Leave tracemalloc's own bookkeeping out of the report
+        snapshot = snapshot.filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__)
+        ])
+        alloc_path = self.output_dir / f"{stamp}-alloc.txt"
+        with alloc_path.open("w", encoding="utf-8") as f:
+            for stat in snapshot.statistics('lineno')[:self.top_allocations]:
+                f.write(f"{stat}\n")
+        
+        return stacks_path
+
 class MouseRecorder:
     def __init__(self):
         self.root = tk.Tk()
@@ -69,14 +462,22 @@ class MouseRecorder:
         self.current_recording = []
         self.recordings = {}
         self.recording_thread = None
+        self.playback_thread = None
+        self.playback_end_time = 0
         self.mouse_controller = mouse.Controller()
+        self.last_input_time = time.time()
         
         # Add profile variables
         self.profiles = {}
         self.current_profile = None
+        self.schedules = []
         
         self.profile_manager = ProfileManager()
         
+        # Profiling reports go next to the profile store
+        self.profiler = RuntimeProfiler(self.profile_manager.path.parent / "profiling")
+        
+        self.setup_scheduler()
         self.setup_gui()
         self.load_profiles()
         self.setup_hotkeys()
@@ -159,7 +560,8 @@ class MouseRecorder:
         # Recording buttons with better emojis
         for btn_text, cmd in [
             ("Rename", self.rename_recording),
-            ("Delete", self.delete_recording)
+            ("Delete", self.delete_recording),
+            ("Schedule", self.edit_schedules)
         ]:
             ttk.Button(
                 recording_buttons,
@@ -193,6 +595,13 @@ class MouseRecorder:
                 self.stop_button = btn
                 btn.configure(state="disabled")
         
+        self.profile_button = ttk.Button(
+            controls_frame,
+            text="🔬 Start Profiling (F9)",
+            command=self.toggle_profiling
+        )
+        self.profile_button.pack(fill=tk.X)
+        
         # Settings frame
         settings_frame = ttk.LabelFrame(right_panel, text="Playback Settings", padding="10")
         settings_frame.pack(fill=tk.X, pady=(0, 10))
@@ -229,6 +638,34 @@ class MouseRecorder:
         )
         self.gap_duration.grid(row=1, column=1, sticky="w", padx=5)
         
+        # Idle compression settings
+        self.compress_idle = tk.BooleanVar()
+        ttk.Checkbutton(
+            settings_grid,
+            text="Compress Idle",
+            variable=self.compress_idle
+        ).grid(row=2, column=0, columnspan=2, sticky="w", padx=5, pady=(5, 0))
+        
+        ttk.Label(settings_grid, text="Idle over (s):").grid(row=3, column=0, sticky="w", padx=5)
+        self.idle_threshold = ttk.Spinbox(
+            settings_grid,
+            from_=0.5,
+            to=60,
+            width=5,
+            increment=0.5
+        )
+        self.idle_threshold.grid(row=3, column=1, sticky="w", padx=5)
+        
+        ttk.Label(settings_grid, text="Shorten to (s):").grid(row=4, column=0, sticky="w", padx=5)
+        self.idle_cap = ttk.Spinbox(
+            settings_grid,
+            from_=0,
+            to=60,
+            width=5,
+            increment=0.1
+        )
+        self.idle_cap.grid(row=4, column=1, sticky="w", padx=5)
+        
         # Always on top setting
         self.always_on_top = tk.BooleanVar()
         ttk.Checkbutton(
@@ -236,7 +673,7 @@ class MouseRecorder:
             text="Always on Top",
             variable=self.always_on_top,
             command=self.toggle_always_on_top
-        ).grid(row=2, column=0, columnspan=2, sticky="w", padx=5, pady=(5, 0))
+        ).grid(row=5, column=0, columnspan=2, sticky="w", padx=5, pady=(5, 0))
         
         # Status bar at bottom
         status_frame = ttk.Frame(self.main_container)
@@ -258,10 +695,62 @@ class MouseRecorder:
             '<ctrl>+<f7>': self.play_recording,
             '<f8>': self.stop_playback,
             '<ctrl>+<f8>': self.stop_playback,
-            '<esc>': self.stop_playback
+            '<esc>': self.stop_playback,
+            '<f9>': self.toggle_profiling,
+            '<ctrl>+<f9>': self.toggle_profiling
         })
+        self.listener.name = "hotkeys"
         self.listener.start()
 
+    def setup_scheduler(self):
+        self.activity_listener = None
+        self.scheduler = Scheduler(self)
+        self.scheduler.start()
+
+    def set_activity_tracking(self, enabled):
+        # Only hook the mouse while an idle trigger needs it
+        if enabled and self.activity_listener is None:
+            activity_grace = 0.5  # Late events from our own playback still arrive after it ends
+            
+            def on_activity(*args):
+                if self.playing or time.time() - self.playback_end_time < activity_grace:
+                    return
+                self.last_input_time = time.time()
+            
+            self.last_input_time = time.time()
+            self.activity_listener = mouse.Listener(
+                on_move=on_activity,
+                on_click=on_activity,
+                on_scroll=on_activity
+            )
+            self.activity_listener.name = "activity-listener"
+            self.activity_listener.start()
+        elif not enabled and self.activity_listener is not None:
+            self.activity_listener.stop()
+            self.activity_listener = None
+
+    def is_busy(self):
+        return (
+            self.recording
+            or self.playing
+            or (self.playback_thread is not None and self.playback_thread.is_alive())
+        )
+
+    def toggle_profiling(self):
+        self.profiler.toggle(on_report=self.show_profile_report)
+        if self.profiler.active:
+            self.profile_button.configure(text="🔬 Stop Profiling (F9)")
+            self.status_label.configure(text="🔬 Profiling...", foreground="purple")
+        else:
+            self.profile_button.configure(text="🔬 Start Profiling (F9)")
+            self.status_label.configure(text="📄 Writing profile report...", foreground="purple")
+
+    def show_profile_report(self, report, error):
+        if error:
+            self.status_label.configure(text=f"❌ Profile report failed: {error}", foreground="red")
+        else:
+            self.status_label.configure(text=f"📄 Profile saved: {report.name}", foreground="green")
+
     def toggle_recording(self):
         if not self.recording:
             self.start_recording()
@@ -324,7 +813,9 @@ class MouseRecorder:
                         'e': round(time.time() - start_time, 3)
                     })
             
-            with mouse.Listener(on_move=on_move, on_click=on_click) as listener:
+            listener = mouse.Listener(on_move=on_move, on_click=on_click)
+            listener.name = "record-listener"
+            with listener:
                 listener.join()
         
         self.recording_thread = threading.Thread(target=record, daemon=True)
@@ -364,7 +855,6 @@ class MouseRecorder:
                 return
         
         name = self.recordings_list.get(selection[0])
-        actions = self.recordings[name]
         
         try:
             repeat_count = int(self.repeat_count.get())
@@ -373,109 +863,137 @@ class MouseRecorder:
             repeat_count = 1
             gap_seconds = 0
         
+        self.start_playback(name, repeat_count, gap_seconds, self.infinite_loop.get())
+
+    def start_playback(self, name, repeat_count, gap_seconds, infinite, on_done=None):
+        if self.is_busy() or name not in self.recordings:
+            return False
+        
+        actions = self.recordings[name]
+        
+        # Compress idle stretches once, up front, instead of per repeat
+        saved_per_run = 0.0
+        if self.compress_idle.get():
+            try:
+                idle_threshold = float(self.idle_threshold.get())
+                idle_cap = float(self.idle_cap.get())
+                actions, saved_per_run = compress_idle(actions, idle_threshold, idle_cap)
+            except ValueError:
+                actions, saved_per_run = compress_idle(actions, 2.0, 0.5)
+        saved_status = f" ⚡ {saved_per_run:.1f}s saved/run" if saved_per_run > 0 else ""
+        
         self.playing = True
         self.stop_button.configure(state="normal")
         
         def play():
-            repeat_num = 1
-            status_update_time = 0
-            status_update_interval = 0.02  # More frequent updates (20ms)
+            try:
+                repeat_num = 1
+                status_update_time = 0
+                status_update_interval = 0.02  # More frequent updates (20ms)
             
-            while self.playing:
-                # Calculate total time for this iteration
-                total_time = actions[-1]['e'] if actions else 0
+                while self.playing:
+                    # Calculate total time for this iteration
+                    total_time = actions[-1]['e'] if actions else 0
                 
-                start_time = time.time()
-                mouse_pos = None
+                    start_time = time.time()
+                    mouse_pos = None
                 
-                for action in actions:
-                    if not self.playing:
-                        break
+                    for action in actions:
+                        if not self.playing:
+                            break
                     
-                    # Calculate and show remaining time
-                    current_time = time.time()
-                    elapsed = current_time - start_time
-                    remaining = total_time - elapsed
+                        # Calculate and show remaining time
+                        current_time = time.time()
+                        elapsed = current_time - start_time
+                        remaining = total_time - elapsed
                     
-                    if current_time - status_update_time >= status_update_interval:
-                        status = f"▶️ Playing... {remaining:.1f}s left"
-                        if not self.infinite_loop.get():
-                            status += f" ({repeat_num}/{repeat_count})"
-                        else:
-                            status += f" (∞ - {repeat_num})"
-                        self.status_label.configure(text=status, foreground="blue")
-                        status_update_time = current_time
+                        if current_time - status_update_time >= status_update_interval:
+                            status = f"▶️ Playing... {remaining:.1f}s left"
+                            if not infinite:
+                                status += f" ({repeat_num}/{repeat_count})"
+                            else:
+                                status += f" (∞ - {repeat_num})"
+                            status += saved_status
+                            self.status_label.configure(text=status, foreground="blue")
+                            status_update_time = current_time
                     
-                    # Check if we should wait for timing
-                    wait_time = action['e'] - (current_time - start_time)
-                    if wait_time > 0:
-                        # Break wait into small chunks for quick stopping
-                        while wait_time > 0 and self.playing:
-                            sleep_time = min(0.01, wait_time)  # Max 10ms chunks
-                            time.sleep(sleep_time)
-                            wait_time -= sleep_time
+                        # Check if we should wait for timing
+                        wait_time = action['e'] - (current_time - start_time)
+                        if wait_time > 0:
+                            # Break wait into small chunks for quick stopping
+                            while wait_time > 0 and self.playing:
+                                sleep_time = min(0.01, wait_time)  # Max 10ms chunks
+                                time.sleep(sleep_time)
+                                wait_time -= sleep_time
                             
-                            # Update status during wait
+                                # Update status during wait
+                                current_time = time.time()
+                                if current_time - status_update_time >= status_update_interval:
+                                    elapsed = current_time - start_time
+                                    remaining = total_time - elapsed
+                                    status = f"▶️ Playing... {remaining:.1f}s left"
+                                    if not infinite:
+                                        status += f" ({repeat_num}/{repeat_count})"
+                                    else:
+                                        status += f" (∞ - {repeat_num})"
+                                    status += saved_status
+                                    self.status_label.configure(text=status, foreground="blue")
+                                    status_update_time = current_time
+                    
+                        if not self.playing:
+                            break
+                    
+                        # Perform the action
+                        if action['t'] == 'm':
+                            new_x = action['x']
+                            new_y = action['y']
+                            if not mouse_pos or abs(mouse_pos[0] - new_x) > 5 or abs(mouse_pos[1] - new_y) > 5:
+                                self.mouse_controller.position = (new_x, new_y)
+                                mouse_pos = (new_x, new_y)
+                        elif action['t'] == 'c':
+                            self.mouse_controller.position = (action['x'], action['y'])
+                            mouse_pos = (action['x'], action['y'])
+                            if action['p']:
+                                self.mouse_controller.press(getattr(mouse.Button, action['b']))
+                            else:
+                                self.mouse_controller.release(getattr(mouse.Button, action['b']))
+                
+                    if not self.playing:
+                        break
+                
+                    if not infinite:
+                        if repeat_num >= repeat_count:
+                            break
+                        repeat_num += 1
+                    else:
+                        repeat_num += 1
+                
+                    if gap_seconds > 0 and self.playing:
+                        gap_start = time.time()
+                        while self.playing and (time.time() - gap_start) < gap_seconds:
                             current_time = time.time()
                             if current_time - status_update_time >= status_update_interval:
-                                elapsed = current_time - start_time
-                                remaining = total_time - elapsed
-                                status = f"▶️ Playing... {remaining:.1f}s left"
-                                if not self.infinite_loop.get():
+                                remaining_gap = gap_seconds - (current_time - gap_start)
+                                status = f"⏳ Gap: {remaining_gap:.1f}s left"
+                                if not infinite:
                                     status += f" ({repeat_num}/{repeat_count})"
                                 else:
                                     status += f" (∞ - {repeat_num})"
-                                self.status_label.configure(text=status, foreground="blue")
+                                self.status_label.configure(text=status, foreground="orange")
                                 status_update_time = current_time
-                    
-                    if not self.playing:
-                        break
-                    
-                    # Perform the action
-                    if action['t'] == 'm':
-                        new_x = action['x']
-                        new_y = action['y']
-                        if not mouse_pos or abs(mouse_pos[0] - new_x) > 5 or abs(mouse_pos[1] - new_y) > 5:
-                            self.mouse_controller.position = (new_x, new_y)
-                            mouse_pos = (new_x, new_y)
-                    elif action['t'] == 'c':
-                        self.mouse_controller.position = (action['x'], action['y'])
-                        mouse_pos = (action['x'], action['y'])
-                        if action['p']:
-                            self.mouse_controller.press(getattr(mouse.Button, action['b']))
-                        else:
-                            self.mouse_controller.release(getattr(mouse.Button, action['b']))
-                
-                if not self.playing:
-                    break
-                
-                if not self.infinite_loop.get():
-                    if repeat_num >= repeat_count:
-                        break
-                    repeat_num += 1
-                else:
-                    repeat_num += 1
-                
-                if gap_seconds > 0 and self.playing:
-                    gap_start = time.time()
-                    while self.playing and (time.time() - gap_start) < gap_seconds:
-                        current_time = time.time()
-                        if current_time - status_update_time >= status_update_interval:
-                            remaining_gap = gap_seconds - (current_time - gap_start)
-                            status = f"⏳ Gap: {remaining_gap:.1f}s left"
-                            if not self.infinite_loop.get():
-                                status += f" ({repeat_num}/{repeat_count})"
-                            else:
-                                status += f" (∞ - {repeat_num})"
-                            self.status_label.configure(text=status, foreground="orange")
-                            status_update_time = current_time
-                        time.sleep(0.01)  # Small sleep chunks for quick stopping
-        
-            self.playing = False
-            self.stop_button.configure(state="disabled")
-            self.status_label.configure(text="✅ Ready", foreground="green")
+                            time.sleep(0.01)  # Small sleep chunks for quick stopping
+            finally:
+                # Always clean up so the scheduler never waits on a crashed playback
+                self.playback_end_time = time.time()
+                self.playing = False
+                self.stop_button.configure(state="disabled")
+                self.status_label.configure(text="✅ Ready", foreground="green")
+                if on_done:
+                    on_done()
         
-        threading.Thread(target=play, daemon=True).start()
+        self.playback_thread = threading.Thread(target=play, name="playback", daemon=True)
+        self.playback_thread.start()
+        return True
 
     def stop_playback(self):
         if self.playing:
@@ -492,6 +1010,8 @@ class MouseRecorder:
             
         name = self.recordings_list.get(selection[0])
         del self.recordings[name]
+        self.schedules = [job for job in self.schedules if job['recording'] != name]
+        self.scheduler.set_jobs(self.schedules)
         self.update_recordings_list()
         self.save_recordings()
 
@@ -513,7 +1033,11 @@ class MouseRecorder:
             'infinite': False,
             'gap': 0,
             'recordings': {},
-            'always_on_top': False  # Add default value
+            'always_on_top': False,  # Add default value
+            'compress_idle': False,
+            'idle_threshold': 2.0,
+            'idle_cap': 0.5,
+            'schedules': []
         }
         self.update_profile_list()
         self.profile_combo.set(name)
@@ -529,7 +1053,11 @@ class MouseRecorder:
             'infinite': self.infinite_loop.get(),
             'gap': float(self.gap_duration.get()),
             'recordings': self.recordings,
-            'always_on_top': self.always_on_top.get()  # Save always on top state
+            'always_on_top': self.always_on_top.get(),  # Save always on top state
+            'compress_idle': self.compress_idle.get(),
+            'idle_threshold': float(self.idle_threshold.get()),
+            'idle_cap': float(self.idle_cap.get()),
+            'schedules': self.schedules
         }
         self.profile_manager.update_profile(self.current_profile, profile_data)
 
@@ -566,6 +1094,15 @@ class MouseRecorder:
         self.always_on_top.set(always_on_top)
         self.root.attributes('-topmost', always_on_top)
         
+        # Load idle compression settings, older profiles fall back to defaults
+        self.compress_idle.set(profile.get('compress_idle', False))
+        self.idle_threshold.set(profile.get('idle_threshold', 2.0))
+        self.idle_cap.set(profile.get('idle_cap', 0.5))
+        
+        # Load schedules and hand them to the scheduler
+        self.schedules = list(profile.get('schedules', []))
+        self.scheduler.set_jobs(self.schedules)
+        
         self.update_recordings_list()
 
     def update_profile_list(self):
@@ -639,6 +1176,12 @@ class MouseRecorder:
             # Update recordings dict
             self.recordings[dialog.result] = self.recordings.pop(old_name)
             
+            # Keep schedules pointing at the renamed recording
+            for job in self.schedules:
+                if job['recording'] == old_name:
+                    job['recording'] = dialog.result
+            self.scheduler.set_jobs(self.schedules)
+            
             # Update list and maintain selection
             self.update_recordings_list()
             new_index = list(self.recordings.keys()).index(dialog.result)
@@ -666,8 +1209,26 @@ class MouseRecorder:
             
             self.save_profiles()
 
+    def edit_schedules(self):
+        if not self.current_profile:
+            return
+        
+        selection = self.recordings_list.curselection()
+        recording = self.recordings_list.get(selection[0]) if selection else None
+        dialog = ScheduleDialog(self.root, self.schedules, recording)
+        self.root.wait_window(dialog.dialog)
+        
+        if dialog.result is not None:
+            self.schedules = dialog.result
+            self.scheduler.set_jobs(self.schedules)
+            self.save_profile()
+
     def run(self):
         self.root.mainloop()
+        self.scheduler.stop()
+        report_thread = self.profiler.stop()
+        if report_thread:
+            report_thread.join()
 
 class RenameDialog:
     def __init__(self, parent, title, current_name):
@@ -713,6 +1274,139 @@ class RenameDialog:
     def cancel(self):
         self.dialog.destroy()
 
+class ScheduleDialog:
+    TRIGGER_HINTS = {
+        'interval': "Every N seconds",
+        'cron': "Cron: min hour day month weekday",
+        'idle': "After N seconds of mouse idle"
+    }
+    
+    def __init__(self, parent, schedules, recording):
+        self.dialog = tk.Toplevel(parent)
+        self.dialog.title("Schedules")
+        self.dialog.geometry("420x340")
+        self.dialog.transient(parent)  # Make dialog modal
+        self.dialog.grab_set()
+        
+        self.result = None
+        self.schedules = [dict(job) for job in schedules]
+        self.recording = recording
+        
+        # Center the dialog
+        self.dialog.geometry("+%d+%d" % (
+            parent.winfo_rootx() + parent.winfo_width()/2 - 210,
+            parent.winfo_rooty() + parent.winfo_height()/2 - 170
+        ))
+        
+        frame = ttk.Frame(self.dialog, padding="10")
+        frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Existing schedules
+        self.schedule_list = tk.Listbox(frame, height=6, borderwidth=1, highlightthickness=0)
+        self.schedule_list.pack(fill=tk.BOTH, expand=True)
+        ttk.Button(frame, text="Remove", command=self.remove, width=10).pack(anchor="e", pady=(5, 10))
+        
+        # New schedule for the selected recording
+        add_frame = ttk.LabelFrame(frame, text=f"Add for: {recording or 'no recording selected'}", padding="5")
+        add_frame.pack(fill=tk.X)
+        
+        ttk.Label(add_frame, text="Trigger:").grid(row=0, column=0, sticky="w", padx=5)
+        self.trigger_var = tk.StringVar(value="interval")
+        trigger_combo = ttk.Combobox(
+            add_frame,
+            textvariable=self.trigger_var,
+            values=list(self.TRIGGER_HINTS),
+            state="readonly",
+            width=10
+        )
+        trigger_combo.grid(row=0, column=1, sticky="w", padx=5)
+        trigger_combo.bind('<<ComboboxSelected>>', self.update_hint)
+        
+        ttk.Label(add_frame, text="Value:").grid(row=1, column=0, sticky="w", padx=5)
+        self.spec_var = tk.StringVar(value="60")
+        ttk.Entry(add_frame, textvariable=self.spec_var, width=16).grid(row=1, column=1, sticky="w", padx=5)
+        self.hint_label = ttk.Label(add_frame, foreground="gray")
+        self.hint_label.grid(row=1, column=2, sticky="w", padx=5)
+        
+        ttk.Label(add_frame, text="Overlap:").grid(row=2, column=0, sticky="w", padx=5)
+        self.overlap_var = tk.StringVar(value="skip")
+        ttk.Combobox(
+            add_frame,
+            textvariable=self.overlap_var,
+            values=list(Scheduler.OVERLAP_POLICIES),
+            state="readonly",
+            width=10
+        ).grid(row=2, column=1, sticky="w", padx=5)
+        
+        ttk.Label(add_frame, text="Repeats:").grid(row=3, column=0, sticky="w", padx=5)
+        self.repeats = ttk.Spinbox(add_frame, from_=1, to=999, width=5)
+        self.repeats.set(1)
+        self.repeats.grid(row=3, column=1, sticky="w", padx=5)
+        
+        add_button = ttk.Button(add_frame, text="Add", command=self.add, width=10)
+        add_button.grid(row=3, column=2, sticky="e", padx=5)
+        if not recording:
+            add_button.configure(state="disabled")
+        
+        self.error_label = ttk.Label(frame, foreground="red")
+        self.error_label.pack(fill=tk.X, pady=(5, 0))
+        
+        btn_frame = ttk.Frame(frame)
+        btn_frame.pack(fill=tk.X, pady=(5, 0))
+        
+        ttk.Button(btn_frame, text="OK", command=self.ok).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(btn_frame, text="Cancel", command=self.cancel).pack(side=tk.RIGHT)
+        
+        self.update_hint()
+        self.update_schedule_list()
+        self.dialog.bind('<Escape>', lambda e: self.cancel())
+    
+    def update_hint(self, event=None):
+        self.hint_label.configure(text=self.TRIGGER_HINTS[self.trigger_var.get()])
+    
+    def update_schedule_list(self):
+        self.schedule_list.delete(0, tk.END)
+        for job in self.schedules:
+            self.schedule_list.insert(
+                tk.END,
+                f"{job['recording']} - {job['trigger']} {job['spec']} "
+                f"x{job.get('repeats', 1)} ({job.get('overlap', 'skip')})"
+            )
+    
+    def add(self):
+        try:
+            job = {
+                'recording': self.recording,
+                'trigger': self.trigger_var.get(),
+                'spec': self.spec_var.get().strip(),
+                'repeats': int(self.repeats.get()),
+                'overlap': self.overlap_var.get(),
+                'enabled': True
+            }
+            # Validate before accepting
+            make_trigger(job, time.time).next_delay()
+        except ValueError as e:
+            self.error_label.configure(text=f"Invalid schedule: {e}")
+            return
+        
+        self.error_label.configure(text="")
+        self.schedules.append(job)
+        self.update_schedule_list()
+    
+    def remove(self):
+        selection = self.schedule_list.curselection()
+        if not selection:
+            return
+        del self.schedules[selection[0]]
+        self.update_schedule_list()
+    
+    def ok(self):
+        self.result = self.schedules
+        self.dialog.destroy()
+    
+    def cancel(self):
+        self.dialog.destroy()
+
 if __name__ == "__main__":
     app = MouseRecorder()
     app.run()
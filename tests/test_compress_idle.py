@@ -0,0 +1,69 @@
+import pytest
+
+from recorder import compress_idle
+
+
+def move(e):
+    return {'t': 'm', 'x': 0, 'y': 0, 'e': e}
+
+
+def click(e, pressed, button='left'):
+    return {'t': 'c', 'x': 0, 'y': 0, 'b': button, 'p': pressed, 'e': e}
+
+
+def times(actions):
+    return [action['e'] for action in actions]
+
+
+def test_short_gaps_are_untouched():
+    actions = [move(0.0), move(0.5), move(1.0)]
+    compressed, saved = compress_idle(actions, 2, 0.5)
+    assert times(compressed) == [0.0, 0.5, 1.0]
+    assert saved == 0
+
+
+def test_long_gap_between_moves_is_capped():
+    actions = [move(0.0), move(10.0), move(10.2)]
+    compressed, saved = compress_idle(actions, 2, 0.5)
+    assert times(compressed) == [0.0, 0.5, 0.7]
+    assert saved == pytest.approx(9.5)
+
+
+def test_gap_before_click_is_kept():
+    actions = [move(0.0), move(10.0), click(30.0, True), click(30.1, False)]
+    compressed, saved = compress_idle(actions, 2, 0.5)
+    assert times(compressed) == [0.0, 0.5, 20.5, 20.6]
+    assert saved == pytest.approx(9.5)
+
+
+def test_gap_while_held_is_kept():
+    actions = [click(0.0, True), move(10.0), click(20.0, False), move(30.0)]
+    compressed, saved = compress_idle(actions, 2, 0.5)
+    assert times(compressed) == [0.0, 10.0, 20.0, 20.5]
+    assert saved == pytest.approx(9.5)
+
+
+def test_gap_kept_while_another_button_is_still_held():
+    actions = [
+        click(0.0, True, 'left'),
+        click(0.1, True, 'right'),
+        click(0.2, False, 'right'),
+        move(10.0),
+        click(10.1, False, 'left'),
+        move(20.0),
+    ]
+    compressed, saved = compress_idle(actions, 2, 0.5)
+    assert times(compressed)[:5] == [0.0, 0.1, 0.2, 10.0, 10.1]
+    assert times(compressed)[5] == pytest.approx(10.6)
+
+
+def test_negative_cap_is_clamped_to_zero():
+    actions = [move(0.0), move(5.0), move(10.0)]
+    compressed, saved = compress_idle(actions, 2, -5)
+    assert times(compressed) == [0.0, 0.0, 0.0]
+    assert saved == pytest.approx(10.0)
+
+
+def test_non_positive_threshold_is_rejected():
+    with pytest.raises(ValueError):
+        compress_idle([move(0.0)], 0, 0.5)
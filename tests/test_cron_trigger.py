@@ -0,0 +1,62 @@
+from datetime import datetime
+
+import pytest
+
+from recorder import CronTrigger
+
+
+def test_parse_field_values():
+    assert CronTrigger.parse_field('*', 0, 6) == set(range(7))
+    assert CronTrigger.parse_field('5', 0, 59) == {5}
+    assert CronTrigger.parse_field('1-3', 1, 12) == {1, 2, 3}
+    assert CronTrigger.parse_field('1,15,30', 1, 31) == {1, 15, 30}
+
+
+def test_parse_field_steps():
+    assert CronTrigger.parse_field('*/15', 0, 59) == {0, 15, 30, 45}
+    assert CronTrigger.parse_field('10-20/5', 0, 59) == {10, 15, 20}
+    assert CronTrigger.parse_field('50/5', 0, 59) == {50, 55}
+
+
+@pytest.mark.parametrize('field', ['60', '5-1', '*/0', 'x'])
+def test_parse_field_rejects_invalid(field):
+    with pytest.raises(ValueError):
+        CronTrigger.parse_field(field, 0, 59)
+
+
+def test_requires_five_fields():
+    with pytest.raises(ValueError):
+        CronTrigger('* * *')
+
+
+def test_day_fields_match_either_when_both_restricted():
+    trigger = CronTrigger('0 9 1 * 1')
+    assert trigger.matches(datetime(2026, 10, 1, 9, 0))  # Thursday the 1st
+    assert trigger.matches(datetime(2026, 10, 5, 9, 0))  # Monday
+    assert not trigger.matches(datetime(2026, 10, 6, 9, 0))
+
+
+def test_day_fields_match_both_when_one_is_wildcard():
+    trigger = CronTrigger('0 9 * * 1')
+    assert trigger.matches(datetime(2026, 10, 5, 9, 0))
+    assert not trigger.matches(datetime(2026, 10, 1, 9, 0))
+
+
+def test_next_delay_lands_on_matching_minute():
+    trigger = CronTrigger('*/15 * * * *')
+    delay = trigger.next_delay()
+    assert 0 < delay <= 15 * 60
+    due = datetime.fromtimestamp(trigger.last_due)
+    assert due.minute % 15 == 0 and due.second == 0
+
+
+def test_next_delay_never_matching_expression():
+    with pytest.raises(ValueError):
+        CronTrigger('0 0 31 2 *').next_delay()
+
+
+def test_next_delay_finds_leap_day():
+    trigger = CronTrigger('0 0 29 2 *')
+    trigger.next_delay()
+    due = datetime.fromtimestamp(trigger.last_due)
+    assert (due.month, due.day, due.hour, due.minute) == (2, 29, 0, 0)
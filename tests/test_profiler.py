@@ -0,0 +1,58 @@
+import time
+
+from recorder import RuntimeProfiler
+
+
+def busy_work():
+    return [list(range(100)) for _ in range(1000)]
+
+
+def test_stop_writes_reports(tmp_path):
+    profiler = RuntimeProfiler(tmp_path, interval=0.001)
+    reports = []
+    profiler.start()
+    data = busy_work()
+    time.sleep(0.05)
+    profiler.stop(on_report=lambda report, error: reports.append((report, error))).join()
+
+    assert len(data) == 1000
+    [(stacks_path, error)] = reports
+    assert error is None
+    assert stacks_path.name.endswith("-stacks.folded")
+
+    lines = stacks_path.read_text(encoding="utf-8").splitlines()
+    assert lines
+    for line in lines:
+        stack, count = line.rsplit(" ", 1)
+        assert ";" in stack
+        assert int(count) > 0
+
+    alloc_path = stacks_path.with_name(stacks_path.name.replace("-stacks.folded", "-alloc.txt"))
+    assert alloc_path.read_text(encoding="utf-8").strip()
+
+
+def test_stop_reports_write_errors(tmp_path):
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    profiler = RuntimeProfiler(blocker / "profiling")
+    reports = []
+    profiler.start()
+    profiler.stop(on_report=lambda report, error: reports.append((report, error))).join()
+
+    [(report, error)] = reports
+    assert report is None
+    assert isinstance(error, OSError)
+
+
+def test_stop_when_off_returns_none(tmp_path):
+    profiler = RuntimeProfiler(tmp_path)
+    assert profiler.stop() is None
+
+
+def test_toggle_flips_active(tmp_path):
+    profiler = RuntimeProfiler(tmp_path)
+    assert profiler.toggle() is None
+    assert profiler.active
+    report_thread = profiler.toggle()
+    assert not profiler.active
+    report_thread.join()
@@ -0,0 +1,164 @@
+import asyncio
+import time
+
+import pytest
+
+from recorder import IdleTrigger, IntervalTrigger, Scheduler
+
+
+class FakeRecorder:
+    def __init__(self):
+        self.playing = False
+        self.last_input_time = time.time()
+        self.started = []
+        self.on_done = None
+        self.tracking = False
+
+    def is_busy(self):
+        return self.playing
+
+    def start_playback(self, name, repeat_count, gap_seconds, infinite, on_done=None):
+        if self.playing:
+            return False
+        if name == 'broken':
+            raise RuntimeError("playback failed")
+        self.playing = True
+        self.started.append(name)
+        self.on_done = on_done
+        return True
+
+    def finish(self):
+        self.playing = False
+        on_done, self.on_done = self.on_done, None
+        if on_done:
+            on_done()
+
+    def stop_playback(self):
+        self.finish()
+
+    def set_activity_tracking(self, enabled):
+        self.tracking = enabled
+
+
+def wait_until(condition, timeout=2.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+
+@pytest.fixture
+def scheduler():
+    recorder = FakeRecorder()
+    scheduler = Scheduler(recorder)
+    scheduler.start()
+    yield scheduler
+    scheduler.stop()
+
+
+def submit(scheduler, job):
+    async def run():
+        scheduler._submit(job)
+    asyncio.run_coroutine_threadsafe(run(), scheduler.loop).result()
+
+
+def job(name, overlap):
+    return {'recording': name, 'trigger': 'interval', 'spec': 60, 'overlap': overlap}
+
+
+def test_skip_drops_run_while_busy(scheduler):
+    recorder = scheduler.recorder
+    submit(scheduler, job('a', 'skip'))
+    assert wait_until(lambda: recorder.started == ['a'])
+
+    submit(scheduler, job('b', 'skip'))
+    recorder.finish()
+    time.sleep(0.3)
+    assert recorder.started == ['a']
+
+
+def test_queue_runs_after_current_playback(scheduler):
+    recorder = scheduler.recorder
+    submit(scheduler, job('a', 'queue'))
+    assert wait_until(lambda: recorder.started == ['a'])
+
+    submit(scheduler, job('b', 'queue'))
+    time.sleep(0.1)
+    assert recorder.started == ['a']
+    recorder.finish()
+    assert wait_until(lambda: recorder.started == ['a', 'b'])
+
+
+def test_preempt_stops_current_playback(scheduler):
+    recorder = scheduler.recorder
+    submit(scheduler, job('a', 'queue'))
+    submit(scheduler, job('b', 'queue'))
+    assert wait_until(lambda: recorder.started == ['a'])
+
+    submit(scheduler, job('p', 'preempt'))
+    assert wait_until(lambda: recorder.started == ['a', 'p'])
+    recorder.finish()
+    assert wait_until(lambda: recorder.started == ['a', 'p', 'b'])
+
+
+def test_duplicate_submits_are_ignored(scheduler):
+    recorder = scheduler.recorder
+    running = job('a', 'queue')
+    queued = job('b', 'queue')
+    submit(scheduler, running)
+    assert wait_until(lambda: recorder.started == ['a'])
+
+    submit(scheduler, running)
+    submit(scheduler, queued)
+    submit(scheduler, queued)
+    recorder.finish()
+    assert wait_until(lambda: recorder.started == ['a', 'b'])
+    recorder.finish()
+    time.sleep(0.3)
+    assert recorder.started == ['a', 'b']
+
+
+def test_failed_start_does_not_stop_runner(scheduler):
+    recorder = scheduler.recorder
+    submit(scheduler, job('broken', 'queue'))
+    submit(scheduler, job('a', 'queue'))
+    assert wait_until(lambda: recorder.started == ['a'])
+
+
+def test_activity_tracking_follows_idle_jobs(scheduler):
+    recorder = scheduler.recorder
+    scheduler.set_jobs([{'recording': 'a', 'trigger': 'idle', 'spec': 60}])
+    assert wait_until(lambda: recorder.tracking)
+
+    scheduler.set_jobs([job('a', 'skip')])
+    assert wait_until(lambda: not recorder.tracking)
+
+
+def test_interval_trigger_skips_missed_ticks():
+    trigger = IntervalTrigger(10)
+    due = trigger.next_time
+    trigger.is_due()
+    assert trigger.next_time == due + 10
+
+    trigger.next_time = time.time() - 100
+    trigger.is_due()
+    assert trigger.next_time > time.time()
+    assert trigger.next_delay() == pytest.approx(10, abs=0.5)
+
+
+def test_idle_trigger_fires_once_per_idle_stretch():
+    last_input = [time.time() - 10]
+    trigger = IdleTrigger(5, lambda: last_input[0])
+    assert trigger.next_delay() == 0
+    assert trigger.is_due()
+    assert not trigger.is_due()
+    assert trigger.next_delay() == 5
+
+    last_input[0] = time.time()
+    assert not trigger.is_due()
+    assert trigger.next_delay() == pytest.approx(5, abs=0.5)
+
+    last_input[0] = time.time() - 6
+    assert trigger.is_due()